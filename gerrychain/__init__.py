@@ -1,4 +1,3 @@
-from modulefinder import Module
 import warnings
 
 from ._version import get_versions
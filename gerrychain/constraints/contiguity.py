@@ -1,3 +1,4 @@
+from collections import deque
 from heapq import heappop, heappush
 from itertools import count
 
@@ -236,7 +237,16 @@ def contiguous_components(partition: Partition) -> Dict[int, list]:
     :rtype: dict
     """
     return {
-        part: [subgraph.subgraph(nodes) for nodes in nx.connected_components(subgraph)]
+        part: (
+            # Parts are almost always connected, in which case the part's own
+            # subgraph is the only component and we can skip rebuilding it.
+            # Empty parts have no components at all.
+            [subgraph]
+            if len(subgraph) > 0 and nx.is_connected(subgraph)
+            else [
+                subgraph.subgraph(nodes) for nodes in nx.connected_components(subgraph)
+            ]
+        )
         for part, subgraph in partition.subgraphs.items()
     }
 
@@ -252,7 +262,7 @@ def _bfs(graph: Dict[int, list]) -> bool:
     :returns: is this graph connected?
     :rtype: bool
     """
-    q = [next(iter(graph))]
+    q = deque([next(iter(graph))])
     visited = set()
     total_vertices = len(graph)
 
@@ -261,14 +271,14 @@ def _bfs(graph: Dict[int, list]) -> bool:
     if total_vertices <= 1:
         return True
 
-    # bfs!
-    while len(q) > 0:
-        current = q.pop(0)
-        neighbors = graph[current]
+    # bfs! We only need the number of vertices we can reach, so we keep a
+    # FIFO queue of vertices rather than building up the component itself.
+    while q:
+        current = q.popleft()
 
-        for neighbor in neighbors:
+        for neighbor in graph[current]:
             if neighbor not in visited:
                 visited.add(neighbor)
-                q += [neighbor]
+                q.append(neighbor)
 
     return total_vertices == len(visited)
@@ -11,7 +11,6 @@ This module relies on NetworkX, pandas, and geopandas, which should be installed
 imported as required.
 """
 
-import functools
 import json
 from typing import Any
 import warnings
@@ -23,7 +22,7 @@ import pandas as pd
 
 from .adjacency import neighbors
 from .geo import GeometryError, invalid_geometries, reprojected
-from typing import List, Iterable, Optional, Set, Tuple, Union
+from typing import FrozenSet, List, Iterable, Optional, Set, Tuple, Union
 
 
 def json_serialize(input_object: Any) -> Optional[int]:
@@ -70,7 +69,13 @@ class Graph(networkx.Graph):
         :returns: The converted graph as an instance of this class.
         :rtype: Graph
         """
-        g = cls(graph)
+        # Copy the nodes and edges over directly. Passing the graph to the
+        # constructor goes through its dict-of-dicts adjacency and so visits
+        # every edge twice.
+        g = cls()
+        g.graph.update(graph.graph)
+        g.add_nodes_from(graph.nodes(data=True))
+        g.add_edges_from(graph.edges(data=True))
         return g
 
     @classmethod
@@ -86,8 +91,23 @@ class Graph(networkx.Graph):
         """
         with open(json_file) as f:
             data = json.load(f)
-        g = json_graph.adjacency_graph(data)
-        graph = cls.from_networkx(g)
+
+        if data.get("multigraph") or data.get("directed"):
+            graph = cls.from_networkx(json_graph.adjacency_graph(data))
+        else:
+            # Build the graph straight from the freshly parsed data instead of
+            # going through json_graph.adjacency_graph, which builds a
+            # networkx.Graph that from_networkx would then copy a second time.
+            graph = cls()
+            graph.graph.update(data.get("graph", []))
+            node_ids = [node.pop("id") for node in data["nodes"]]
+            graph.add_nodes_from(zip(node_ids, data["nodes"]))
+            graph.add_edges_from(
+                (source, neighbor.pop("id"), neighbor)
+                for source, neighbors in zip(node_ids, data["adjacency"])
+                for neighbor in neighbors
+            )
+
         graph.issue_warnings()
         return graph
 
@@ -115,8 +135,10 @@ class Graph(networkx.Graph):
         else:
             remove_geometries(data)
 
+        # Encode the whole document in one call and write it out at once;
+        # json.dump encodes and writes it piece by piece, which is much slower.
         with open(json_file, "w") as f:
-            json.dump(data, f, default=json_serialize)
+            f.write(json.dumps(data, default=json_serialize))
 
     @classmethod
     def from_file(
@@ -239,7 +261,6 @@ class Graph(networkx.Graph):
             df = reprojected(dataframe)
             if ignore_errors:
                 invalid_reproj = invalid_geometries(df)
-                print(invalid_reproj)
                 if len(invalid_reproj) > 0:
                     raise GeometryError(
                         "Invalid geometries at rows {} after "
@@ -326,8 +347,13 @@ class Graph(networkx.Graph):
 
         check_dataframe(df[columns])
 
-        column_dictionaries = df.to_dict("index")
-        networkx.set_node_attributes(self, column_dictionaries)
+        # Pull each column out as a list once, then merge each row into its
+        # node's attributes in a single pass, skipping rows with no node.
+        column_names = list(df.columns)
+        values = zip(*(df[column].tolist() for column in column_names))
+        for node_id, row in zip(df.index.tolist(), values):
+            if node_id in self:
+                self.nodes[node_id].update(zip(column_names, row))
 
         if hasattr(self, "data"):
             self.data[columns] = df[columns]  # type: ignore
@@ -369,23 +395,28 @@ class Graph(networkx.Graph):
 
         check_dataframe(df)
 
-        column_dictionaries = df.to_dict()
+        # With repeated index labels, df.loc below would return several rows
+        # for one node and shift every later row onto the wrong node. Keep the
+        # last row for each label, which is the row that used to win.
+        if not df.index.is_unique:
+            df = df[~df.index.duplicated(keep="last")]
 
         if left_index is not None:
             ids_to_index = networkx.get_node_attributes(self, left_index)
+            node_ids = list(ids_to_index.keys())
+            indices = list(ids_to_index.values())
         else:
-            # When the left_index is node ID, the matching is just
-            # a redundant {node: node} dictionary
-            ids_to_index = dict(zip(self.nodes, self.nodes))
-
-        node_attributes = {
-            node_id: {
-                column: values[index] for column, values in column_dictionaries.items()
-            }
-            for node_id, index in ids_to_index.items()
-        }
-
-        networkx.set_node_attributes(self, node_attributes)
+            # When the left_index is node ID, the rows are looked up
+            # by the node IDs themselves
+            node_ids = indices = list(self.nodes)
+
+        # Let pandas line the rows up with the nodes, then merge each row into
+        # its node's attributes in a single pass over the nodes.
+        rows = df.loc[indices]
+        column_names = list(rows.columns)
+        values = zip(*(rows[column].tolist() for column in column_names))
+        for node_id, row in zip(node_ids, values):
+            self.nodes[node_id].update(zip(column_names, row))
 
     @property
     def islands(self) -> Set:
@@ -393,7 +424,7 @@ class Graph(networkx.Graph):
         :returns: The set of degree-0 nodes.
         :rtype: Set
         """
-        return set(node for node in self if self.degree[node] == 0)
+        return {node for node, degree in self.degree if degree == 0}
 
     def warn_for_islands(self) -> None:
         """
@@ -402,7 +433,7 @@ class Graph(networkx.Graph):
         :raises: UserWarning if the graph has any islands (degree-0 nodes).
         """
         islands = self.islands
-        if len(self.islands) > 0:
+        if islands:
             warnings.warn(
                 "Found islands (degree-0 nodes). Indices of islands: {}".format(islands)
             )
@@ -428,22 +459,105 @@ def add_boundary_perimeters(graph: Graph, geometries: pd.Series) -> None:
     :returns: The updated graph.
     :rtype: Graph
     """
+    import shapely
     from shapely.ops import unary_union
-    from shapely.prepared import prep
+    from shapely.strtree import STRtree
+
+    # Test every polygon boundary against the outer boundary with a single
+    # spatial index query instead of one Python-level predicate call each.
+    boundaries = geometries.boundary
+    tree = STRtree(boundaries.values)
+    intersecting = tree.query(unary_union(geometries).boundary, predicate="intersects")
+
+    # Use plain Python containers in the loop below; indexing a pandas
+    # Series once or twice per node costs far more than a set or dict lookup.
+    boundary_nodes = set(geometries.index[intersecting])
+
+    # Compute all of the perimeters in one vectorized call rather than
+    # rebuilding each polygon's boundary inside the loop.
+    perimeters = dict(
+        zip(geometries.index, shapely.length(boundaries.values).tolist())
+    )
+
+    # Total up the shared perimeter of every node in a single pass over the
+    # edges instead of summing over each boundary node's neighbors.
+    shared_perimeters = dict.fromkeys(graph, 0)
+    for u, v, shared_perim in graph.edges(data="shared_perim"):
+        shared_perimeters[u] += shared_perim
+        shared_perimeters[v] += shared_perim
+
+    for node, data in graph.nodes(data=True):
+        is_boundary_node = node in boundary_nodes
+        data["boundary_node"] = is_boundary_node
+        if is_boundary_node:
+            data["boundary_perim"] = perimeters[node] - shared_perimeters[node]
+
+
+def sparse_laplacian(
+    graph: Graph,
+    nodes: List[Any],
+    weights: Optional[Any] = None,
+    normalized: bool = False,
+) -> Any:
+    """
+    Builds the Laplacian of a graph as a sparse matrix directly from the
+    (row, column, weight) triplets of its edges, without ever forming the
+    dense N x N matrix.
 
-    prepared_boundary = prep(unary_union(geometries).boundary)
+    :param graph: The graph.
+    :type graph: Graph
+    :param nodes: The nodes of the graph, in the order of the rows and
+        columns of the Laplacian.
+    :type nodes: List[Any]
+    :param weights: The weight of each edge, in the order of ``graph.edges``.
+        If None, the "weight" attribute of each edge is used, defaulting to 1.
+        Default is None.
+    :type weights: Optional[numpy.ndarray], optional
+    :param normalized: Whether to build the normalized Laplacian
+        :math:`I - D^{-1/2} A D^{-1/2}` instead of :math:`D - A`.
+        Default is False.
+    :type normalized: bool, optional
+
+    :returns: The Laplacian of the graph.
+    :rtype: scipy.sparse.csr_array
+    """
+    import numpy as np
+    from scipy import sparse
+
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    m = graph.number_of_edges()
+
+    heads = np.fromiter((index[u] for u, _ in graph.edges), dtype=int, count=m)
+    tails = np.fromiter((index[v] for _, v in graph.edges), dtype=int, count=m)
+    if weights is None:
+        weights = np.fromiter(
+            (weight for _, _, weight in graph.edges(data="weight", default=1)),
+            dtype=float,
+            count=m,
+        )
 
-    boundary_nodes = geometries.boundary.apply(prepared_boundary.intersects)
+    adjacency = sparse.csr_array(
+        (
+            np.concatenate([weights, weights]),
+            (np.concatenate([heads, tails]), np.concatenate([tails, heads])),
+        ),
+        shape=(n, n),
+    )
+    degrees = np.asarray(adjacency.sum(axis=1)).ravel()
+
+    if normalized:
+        # Isolated nodes get a zero row and column, as in
+        # networkx.normalized_laplacian_matrix, rather than dividing by zero.
+        connected = degrees > 0
+        scale = sparse.diags(
+            np.divide(1, np.sqrt(degrees), out=np.zeros_like(degrees), where=connected)
+        )
+        laplacian = sparse.diags(connected.astype(float)) - scale @ adjacency @ scale
+    else:
+        laplacian = sparse.diags(degrees) - adjacency
 
-    for node in graph:
-        graph.nodes[node]["boundary_node"] = bool(boundary_nodes[node])
-        if boundary_nodes[node]:
-            total_perimeter = geometries[node].boundary.length
-            shared_perimeter = sum(
-                neighbor_data["shared_perim"] for neighbor_data in graph[node].values()
-            )
-            boundary_perimeter = total_perimeter - shared_perimeter
-            graph.nodes[node]["boundary_perim"] = boundary_perimeter
+    return sparse.csr_array(laplacian)
 
 
 def check_dataframe(df: pd.DataFrame) -> None:
@@ -452,9 +566,9 @@ def check_dataframe(df: pd.DataFrame) -> None:
 
     :raises: UserWarning if the dataframe has any NA values.
     """
-    for column in df.columns:
-        if sum(df[column].isna()) > 0:
-            warnings.warn("NA values found in column {}!".format(column))
+    has_na = df.isna().any()
+    for column in df.columns[has_na]:
+        warnings.warn("NA values found in column {}!".format(column))
 
 
 def remove_geometries(data: networkx.Graph) -> None:
@@ -471,12 +585,11 @@ def remove_geometries(data: networkx.Graph) -> None:
     :returns: None
     """
     for node in data["nodes"]:
-        bad_keys = []
-        for key in node:
-            # having a ``__geo_interface__``` property identifies the object
-            # as being a ``shapely`` geometry object
-            if hasattr(node[key], "__geo_interface__"):
-                bad_keys.append(key)
+        # having a ``__geo_interface__``` property identifies the object
+        # as being a ``shapely`` geometry object
+        bad_keys = [
+            key for key, value in node.items() if hasattr(value, "__geo_interface__")
+        ]
         for key in bad_keys:
             del node[key]
 
@@ -495,14 +608,17 @@ def convert_geometries_to_geojson(data: networkx.Graph) -> None:
     :returns: None
     """
     for node in data["nodes"]:
-        for key in node:
-            # having a ``__geo_interface__``` property identifies the object
-            # as being a ``shapely`` geometry object
-            if hasattr(node[key], "__geo_interface__"):
-                # The ``__geo_interface__`` property is essentially GeoJSON.
-                # This is what :func:`geopandas.GeoSeries.to_json` uses under
-                # the hood.
-                node[key] = node[key].__geo_interface__
+        # having a ``__geo_interface__``` property identifies the object
+        # as being a ``shapely`` geometry object. The ``__geo_interface__``
+        # property is essentially GeoJSON. This is what
+        # :func:`geopandas.GeoSeries.to_json` uses under the hood.
+        node.update(
+            {
+                key: value.__geo_interface__
+                for key, value in node.items()
+                if hasattr(value, "__geo_interface__")
+            }
+        )
 
 
 class FrozenGraph:
@@ -518,13 +634,51 @@ class FrozenGraph:
     :type graph: Graph
     :ivar size: The number of nodes in the graph.
     :type size: int
+    :ivar nodes: The node view of the underlying graph.
+    :type nodes: networkx.classes.reportviews.NodeView
+    :ivar edges: The edge view of the underlying graph.
+    :type edges: networkx.classes.reportviews.EdgeView
+    :ivar _neighbors: Cache of the neighbors of each node looked up so far.
+    :type _neighbors: Dict[Any, Tuple[Any, ...]]
+    :ivar _degrees: Cache of the degree of each node looked up so far.
+    :type _degrees: Dict[Any, int]
+    :ivar _node_data: Cache of the attribute dictionary of each node looked
+        up so far.
+    :type _node_data: Dict[Any, Dict]
+    :ivar _edge_counts: Cache of the results of :meth:`number_of_edges`.
+    :type _edge_counts: Dict[Tuple[Any, Any], int]
+    :ivar _laplacians: Cache of the results of :meth:`subgraph_laplacian`,
+        holding at most ``max_cached_laplacians`` entries.
+    :ivar max_cached_laplacians: How many Laplacians :meth:`subgraph_laplacian`
+        keeps per graph. The cache lives as long as the graph, and each entry
+        can be large, so it is off (0) unless raised on the class.
+    :type max_cached_laplacians: int
+    :type _laplacians: Dict[Tuple[FrozenSet[Any], bool], Tuple[List[Any], Any]]
+    :ivar _node_indices: The nodes of the graph, filled in on first access.
+    :type _node_indices: Optional[Tuple[Any, ...]]
+    :ivar _edge_indices: The edges of the graph, filled in on first access.
+    :type _edge_indices: Optional[Tuple[Tuple[Any, Any], ...]]
 
     Note
     ----
     The class uses `__slots__` for improved memory efficiency.
     """
 
-    __slots__ = ["graph", "size"]
+    __slots__ = [
+        "graph",
+        "size",
+        "nodes",
+        "edges",
+        "_neighbors",
+        "_degrees",
+        "_node_data",
+        "_node_indices",
+        "_edge_indices",
+        "_edge_counts",
+        "_laplacians",
+    ]
+
+    max_cached_laplacians = 0
 
     def __init__(self, graph: Graph) -> None:
         """
@@ -541,40 +695,115 @@ class FrozenGraph:
 
         self.size = len(self.graph)
 
+        # Bind the most frequently used views once so that accessing them
+        # does not have to fall through to the underlying graph every time.
+        self.nodes = self.graph.nodes
+        self.edges = self.graph.edges
+
+        # The graph cannot change, so anything read off of it can be cached.
+        # The caches belong to this instance and are filled in lazily: a
+        # subgraph built for a single proposal only pays for what it uses,
+        # and everything is freed along with the instance.
+        self._neighbors = {}
+        self._degrees = {}
+        self._node_data = {}
+        self._node_indices = None
+        self._edge_indices = None
+        self._edge_counts = {}
+        self._laplacians = {}
+
     def __len__(self) -> int:
         return self.size
 
-    def __getattribute__(self, __name: str) -> Any:
-        try:
-            return object.__getattribute__(self, __name)
-        except AttributeError:
-            return object.__getattribute__(self.graph, __name)
+    def __getattr__(self, __name: str) -> Any:
+        # Only called when the normal lookup fails, so the attributes and
+        # methods defined on this class are resolved without any overhead.
+        if __name in FrozenGraph.__slots__:
+            # The slot has not been filled yet (e.g. while unpickling or
+            # copying), so there is no underlying graph to delegate to.
+            # Looking up ``self.graph`` here would recurse forever.
+            raise AttributeError(__name)
+        return getattr(self.graph, __name)
 
     def __getitem__(self, __name: str) -> Any:
         return self.graph[__name]
 
     def __iter__(self) -> Iterable[Any]:
-        yield from self.node_indices
+        return iter(self.node_indices)
 
-    @functools.lru_cache(16384)
     def neighbors(self, n: Any) -> Tuple[Any, ...]:
-        return tuple(self.graph.neighbors(n))
+        neighbors = self._neighbors.get(n)
+        if neighbors is None:
+            neighbors = self._neighbors[n] = tuple(self.graph.neighbors(n))
+        return neighbors
 
-    @functools.cached_property
-    def node_indices(self) -> Iterable[Any]:
-        return self.graph.node_indices
+    @property
+    def node_indices(self) -> Tuple[Any, ...]:
+        # Stored as a tuple rather than a set: it is only ever iterated over,
+        # and iterating a tuple is cheaper and happens in a fixed order.
+        if self._node_indices is None:
+            self._node_indices = tuple(self.graph.nodes)
+        return self._node_indices
 
-    @functools.cached_property
-    def edge_indices(self) -> Iterable[Any]:
-        return self.graph.edge_indices
+    @property
+    def edge_indices(self) -> Tuple[Tuple[Any, Any], ...]:
+        if self._edge_indices is None:
+            self._edge_indices = tuple(self.graph.edges)
+        return self._edge_indices
 
-    @functools.lru_cache(16384)
     def degree(self, n: Any) -> int:
-        return self.graph.degree(n)
+        degree = self._degrees.get(n)
+        if degree is None:
+            degree = self._degrees[n] = self.graph.degree(n)
+        return degree
+
+    def number_of_edges(self, u: Any = None, v: Any = None) -> int:
+        count = self._edge_counts.get((u, v))
+        if count is None:
+            count = self._edge_counts[u, v] = self.graph.number_of_edges(u, v)
+        return count
 
-    @functools.lru_cache(65536)
     def lookup(self, node: Any, field: str) -> Any:
-        return self.graph.nodes[node][field]
+        data = self._node_data.get(node)
+        if data is None:
+            data = self._node_data[node] = self.nodes[node]
+        return data[field]
+
+    def subgraph_laplacian(
+        self, nodes: FrozenSet[Any], normalized: bool = False
+    ) -> Tuple[List[Any], Any]:
+        """
+        The sparse Laplacian of the subgraph induced by ``nodes``. The graph
+        cannot change, so when ``max_cached_laplacians`` is positive the
+        result is cached and shared by every caller asking for the same set
+        of nodes. Once the cache is full, the oldest Laplacian is dropped for
+        each new one.
+
+        :param nodes: The nodes of the subgraph.
+        :type nodes: FrozenSet[Any]
+        :param normalized: Whether to build the normalized Laplacian.
+            Default is False.
+        :type normalized: bool, optional
+
+        :returns: The nodes of the subgraph, in the order of the rows and
+            columns of the Laplacian, and the Laplacian itself.
+        :rtype: Tuple[List[Any], scipy.sparse.csr_array]
+        """
+        key = (nodes, normalized)
+        result = self._laplacians.get(key)
+        if result is None:
+            subgraph = self.graph.subgraph(nodes)
+            node_list = list(subgraph)
+            result = (
+                node_list,
+                sparse_laplacian(subgraph, node_list, normalized=normalized),
+            )
+
+            if self.max_cached_laplacians > 0:
+                while len(self._laplacians) >= self.max_cached_laplacians:
+                    del self._laplacians[next(iter(self._laplacians))]
+                self._laplacians[key] = result
+        return result
 
     def subgraph(self, nodes: Iterable[Any]) -> "FrozenGraph":
         return FrozenGraph(self.graph.subgraph(nodes))
@@ -1,9 +1,68 @@
-import networkx as nx
+import numpy as np
 from numpy import linalg as LA
+from scipy import sparse
+from scipy.sparse.linalg import eigsh
 import random
 from ..graph import Graph
+from ..graph.graph import sparse_laplacian
 from ..partition import Partition
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
+
+# Below this many nodes a dense eigendecomposition beats the sparse solver.
+DENSE_EIGENSOLVER_MAX_NODES = 200
+
+
+def _fiedler_vector(laplacian: sparse.csr_array) -> np.ndarray:
+    """
+    Computes the Fiedler vector of a graph, i.e. the eigenvector belonging to
+    the second smallest eigenvalue of its Laplacian.
+
+    Small Laplacians are solved densely, where LAPACK is faster than an
+    iterative solver. Larger ones use ARPACK's Lanczos solver in shift-invert
+    mode, which only ever needs a sparse factorization of the Laplacian.
+
+    :param laplacian: The (sparse) Laplacian of the graph.
+    :type laplacian: scipy.sparse.csr_array
+
+    :returns: The Fiedler vector.
+    :rtype: numpy.ndarray
+    """
+    if laplacian.shape[0] <= DENSE_EIGENSOLVER_MAX_NODES:
+        _, eigenvectors = LA.eigh(laplacian.toarray())
+        return eigenvectors[:, 1]
+
+    # ARPACK otherwise seeds itself from its own internal state, which would
+    # make the sign of the vector (and so the cut) ignore random.seed.
+    n = laplacian.shape[0]
+    v0 = np.fromiter((random.random() for _ in range(n)), dtype=float, count=n)
+
+    # The Laplacian is singular, so shift slightly below zero rather than at
+    # zero to keep the factorization used by shift-invert mode well posed.
+    eigenvalues, eigenvectors = eigsh(
+        laplacian.tocsc(), k=2, sigma=-1e-3, which="LM", tol=1e-6, v0=v0
+    )
+    return eigenvectors[:, np.argsort(eigenvalues)[1]]
+
+
+def _fiedler_cut(nodes: List[Any], laplacian: sparse.csr_array, part_labels: Dict) -> Dict:
+    """
+    Assigns each node to one of two parts by the sign of its entry in the
+    Fiedler vector of the graph.
+
+    :param nodes: The nodes of the graph, in the order of the rows and
+        columns of ``laplacian``.
+    :type nodes: List[Any]
+    :param laplacian: The (sparse) Laplacian of the graph.
+    :type laplacian: scipy.sparse.csr_array
+    :param part_labels: The labels of the two parts, indexed by False and True.
+    :type part_labels: Dict
+
+    :returns: A dictionary assigning nodes of the graph to their new districts.
+    :rtype: Dict
+    """
+    node_color = (_fiedler_vector(laplacian) > 0).tolist()
+
+    return dict(zip(nodes, map(part_labels.__getitem__, node_color)))
 
 
 def spectral_cut(
@@ -29,27 +88,17 @@ def spectral_cut(
     """
 
     nlist = list(graph.nodes())
-    n = len(nlist)
 
+    weights = None
     if weight_type == "random":
-        for edge in graph.edge_indices:
-            graph.edges[edge]["weight"] = random.random()
-
-    if lap_type == "normalized":
-        LAP = (nx.normalized_laplacian_matrix(graph)).todense()
-
-    else:
-        LAP = (nx.laplacian_matrix(graph)).todense()
+        m = graph.number_of_edges()
+        weights = np.fromiter((random.random() for _ in range(m)), dtype=float, count=m)
 
-    NLMva, NLMve = LA.eigh(LAP)
-    NFv = NLMve[:, 1]
-    xNFv = [NFv.item(x) for x in range(n)]
-
-    node_color = [xNFv[x] > 0 for x in range(n)]
-
-    clusters = {nlist[x]: part_labels[node_color[x]] for x in range(n)}
+    LAP = sparse_laplacian(
+        graph, nlist, weights=weights, normalized=(lap_type == "normalized")
+    )
 
-    return clusters
+    return _fiedler_cut(nlist, LAP, part_labels)
 
 
 def spectral_recom(
@@ -94,10 +143,20 @@ def spectral_recom(
         partition.assignment.mapping[edge[1]],
     )
 
-    subgraph = partition.graph.subgraph(
+    nodes = frozenset(
         partition.parts[parts_to_merge[0]] | partition.parts[parts_to_merge[1]]
     )
 
-    flips = spectral_cut(subgraph, parts_to_merge, weight_type, lap_type)
+    if weight_type == "random":
+        subgraph = partition.graph.subgraph(nodes)
+        flips = spectral_cut(subgraph, parts_to_merge, weight_type, lap_type)
+    else:
+        # Without random weights the Laplacian only depends on the merged
+        # nodes, so the graph can reuse it whenever the same pair of districts
+        # is merged again (if FrozenGraph.max_cached_laplacians allows it).
+        nlist, laplacian = partition.graph.subgraph_laplacian(
+            nodes, normalized=(lap_type == "normalized")
+        )
+        flips = _fiedler_cut(nlist, laplacian, parts_to_merge)
 
     return partition.flip(flips)
@@ -43,18 +43,59 @@ from typing import (
     Set,
     Union,
     Hashable,
+    Iterator,
     Sequence,
     Tuple,
 )
 import warnings
 
 
+def _bfs_edges(graph: nx.Graph, source: Any) -> Iterator[Tuple[Any, Any]]:
+    """
+    Iterates over the edges of a breadth-first search of the graph starting
+    at the source node. The edges are yielded as ``(parent, child)`` pairs in
+    the same order as :func:`networkx.bfs_edges`.
+
+    The adjacency of the graph is copied into a plain dictionary of neighbor
+    lists once up front, so the traversal itself never has to go back through
+    the graph's ``neighbors`` method.
+
+    :param graph: The graph to traverse.
+    :type graph: nx.Graph
+    :param source: The node to start the search from.
+    :type source: Any
+
+    :returns: An iterator over the ``(parent, child)`` edges of the search.
+    :rtype: Iterator[Tuple[Any, Any]]
+    """
+    adj = {node: list(nbrs) for node, nbrs in graph.adjacency()}
+    n = len(adj)
+
+    visited = {source}
+    visit = visited.add
+    queue = deque([source])
+    enqueue = queue.append
+    dequeue = queue.popleft
+    while queue:
+        parent = dequeue()
+        for child in adj[parent]:
+            if child not in visited:
+                visit(child)
+                enqueue(child)
+                yield parent, child
+        if len(visited) == n:
+            return
+
+
 def predecessors(h: nx.Graph, root: Any) -> Dict:
-    return {a: b for a, b in nx.bfs_predecessors(h, root)}
+    return {b: a for a, b in _bfs_edges(h, root)}
 
 
 def successors(h: nx.Graph, root: Any) -> Dict:
-    return {a: b for a, b in nx.bfs_successors(h, root)}
+    succ: Dict = {}
+    for parent, child in _bfs_edges(h, root):
+        succ.setdefault(parent, []).append(child)
+    return succ
 
 
 def random_spanning_tree(
@@ -72,21 +113,28 @@ def random_spanning_tree(
     :returns: The maximal spanning tree represented as a Networkx Graph.
     :rtype: nx.Graph
     """
-    if region_surcharge is None:
-        region_surcharge = dict()
-
-    for edge in graph.edges():
-        weight = random.random()
-        for key, value in region_surcharge.items():
-            # We surcharge edges that cross regions and those that are not in any region
-            if (
-                graph.nodes[edge[0]][key] != graph.nodes[edge[1]][key]
-                or graph.nodes[edge[0]][key] is None
-                or graph.nodes[edge[1]][key] is None
-            ):
-                weight += value
-
-        graph.edges[edge]["random_weight"] = weight
+    if not region_surcharge:
+        # Nothing to surcharge, so every edge just gets a random weight.
+        for _, _, edge_data in graph.edges(data=True):
+            edge_data["random_weight"] = random.random()
+    else:
+        # Look up the region of every node once per key, rather than going
+        # through graph.nodes several times for every edge and every key.
+        regions = [
+            (value, {node: data[key] for node, data in graph.nodes(data=True)})
+            for key, value in region_surcharge.items()
+        ]
+
+        for u, v, edge_data in graph.edges(data=True):
+            weight = random.random()
+            for value, region in regions:
+                # We surcharge edges that cross regions and those that are not
+                # in any region
+                u_region = region[u]
+                if u_region is None or u_region != region[v]:
+                    weight += value
+
+            edge_data["random_weight"] = weight
 
     spanning_tree = tree.minimum_spanning_tree(
         graph, algorithm="kruskal", weight="random_weight"
@@ -112,11 +160,12 @@ def uniform_spanning_tree(
     root = choice(list(graph.node_indices))
     tree_nodes = set([root])
     next_node = {root: None}
+    neighbors = {node: tuple(nbrs) for node, nbrs in graph.adjacency()}
 
     for node in graph.node_indices:
         u = node
         while u not in tree_nodes:
-            next_node[u] = choice(list(graph.neighbors(u)))
+            next_node[u] = choice(neighbors[u])
             u = next_node[u]
 
         u = node
@@ -125,9 +174,9 @@ def uniform_spanning_tree(
             u = next_node[u]
 
     G = nx.Graph()
-    for node in tree_nodes:
-        if next_node[node] is not None:
-            G.add_edge(node, next_node[node])
+    G.add_edges_from(
+        (node, next_node[node]) for node in tree_nodes if next_node[node] is not None
+    )
 
     return G
 
@@ -926,7 +975,7 @@ def epsilon_tree_bipartition(
         )
 
     flips = {}
-    remaining_nodes = graph.node_indices
+    remaining_nodes = set(graph.nodes)
 
     lb_pop = pop_target * (1 - epsilon)
     ub_pop = pop_target * (1 + epsilon)
@@ -1004,7 +1053,7 @@ def recursive_tree_part(
     :rtype: dict
     """
     flips = {}
-    remaining_nodes = graph.node_indices
+    remaining_nodes = set(graph.nodes)
     # We keep a running tally of deviation from ``epsilon`` at each partition
     # and use it to tighten the population constraints on a per-partition
     # basis such that every partition, including the last partition, has a
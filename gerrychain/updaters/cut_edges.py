@@ -33,10 +33,11 @@ def new_cuts(partition) -> Set[Tuple]:
     :returns: The set of edges that were not cut, but now are.
     :rtype: Set[Tuple]
     """
+    mapping = partition.assignment.mapping
     return {
         (node, neighbor)
         for node, neighbor in neighbor_flips(partition)
-        if partition.crosses_parts((node, neighbor))
+        if mapping[node] != mapping[neighbor]
     }
 
 
@@ -48,11 +49,13 @@ def obsolete_cuts(partition) -> Set[Tuple]:
     :returns: The set of edges that were cut, but now are not.
     :rtype: Set[Tuple]
     """
+    mapping = partition.assignment.mapping
+    parent_mapping = partition.parent.assignment.mapping
     return {
         (node, neighbor)
         for node, neighbor in neighbor_flips(partition)
-        if partition.parent.crosses_parts((node, neighbor))
-        and not partition.crosses_parts((node, neighbor))
+        if parent_mapping[node] != parent_mapping[neighbor]
+        and mapping[node] == mapping[neighbor]
     }
 
 
@@ -12,10 +12,11 @@ def neighbor_flips(partition) -> Set[Tuple]:
     :returns: The set of edges that were flipped in the given partition.
     :rtype: Set[Tuple]
     """
+    neighbors = partition.graph.neighbors
     return {
         tuple(sorted((node, neighbor)))
         for node in partition.flips
-        for neighbor in partition.graph.neighbors(node)
+        for neighbor in neighbors(node)
     }
 
 
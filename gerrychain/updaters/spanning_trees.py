@@ -5,6 +5,7 @@ Updaters that compute spanning tree statistics.
 import math
 import numpy
 import networkx
+from scipy.sparse.linalg import splu
 from typing import Dict
 
 
@@ -25,9 +26,19 @@ def _num_spanning_trees_in_district(partition, district: int) -> int:
     :rtype: int
     """
     graph = partition.subgraphs[district]
-    laplacian = networkx.laplacian_matrix(graph)
-    L = numpy.delete(numpy.delete(laplacian.todense(), 0, 0), 1, 1)
-    return math.exp(numpy.linalg.slogdet(L)[1])
+    # A disconnected district has no spanning trees, and its Laplacian minor
+    # is singular, so it cannot be factorized below.
+    if len(graph) == 0 or not networkx.is_connected(graph):
+        return 0
+    if len(graph) == 1:
+        return 1
+
+    laplacian = networkx.laplacian_matrix(graph).astype(float)
+    # Any principal minor of the Laplacian counts the spanning trees, so we
+    # drop the first row and column and take the determinant from a sparse
+    # LU factorization instead of densifying the whole matrix.
+    lu = splu(laplacian[1:, 1:].tocsc())
+    return math.exp(numpy.log(numpy.abs(lu.U.diagonal())).sum())
 
 
 def num_spanning_trees(partition) -> Dict[int, int]:
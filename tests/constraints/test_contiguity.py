@@ -1,3 +1,5 @@
+import networkx
+
 from gerrychain import Partition
 from gerrychain.constraints.contiguity import contiguous_components
 
@@ -16,3 +18,14 @@ def test_contiguous_components(graph):
     }
 
     assert set(components[2][0].nodes) == {3, 4, 5}
+
+
+def test_contiguous_components_of_an_empty_part():
+    partition = Partition(networkx.path_graph(4), {0: 0, 1: 0, 2: 1, 3: 1})
+    flipped = partition.flip({2: 0, 3: 0})
+
+    components = contiguous_components(flipped)
+
+    assert components[1] == []
+    assert len(components[0]) == 1
+    assert set(components[0][0].nodes) == {0, 1, 2, 3}
@@ -1,3 +1,4 @@
+import copy
 import json
 import pathlib
 from tempfile import TemporaryDirectory
@@ -145,6 +146,31 @@ def districtr_plan_file():
         yield filename
 
 
+def test_partition_graph_can_be_deep_copied(example_partition):
+    graph = copy.deepcopy(example_partition.graph)
+
+    assert len(graph) == len(example_partition.graph)
+    assert set(graph.edges) == set(example_partition.graph.edges)
+
+
+def test_frozen_graph_indices_cover_the_graph(example_partition):
+    graph = example_partition.graph
+
+    assert isinstance(graph.node_indices, tuple)
+    assert set(graph.node_indices) == set(graph.nodes)
+    assert set(graph.edge_indices) == set(graph.edges)
+    assert list(graph) == list(graph.node_indices)
+
+
+def test_frozen_graph_lookups_match_the_graph(example_partition):
+    graph = example_partition.graph
+    for node in graph:
+        for _ in range(2):
+            assert set(graph.neighbors(node)) == set(graph.graph.neighbors(node))
+            assert graph.degree(node) == graph.graph.degree(node)
+    assert graph.number_of_edges() == graph.graph.number_of_edges()
+
+
 def test_repr(example_partition):
     assert repr(example_partition) == "<Partition [2 parts]>"
 
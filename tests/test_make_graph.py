@@ -3,12 +3,15 @@ from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 import geopandas as gp
+import networkx
+import numpy
 import pandas
 import pytest
 from shapely.geometry import Polygon
 from pyproj import CRS
 
-from gerrychain.graph import Graph
+from gerrychain.graph import FrozenGraph, Graph
+from gerrychain.graph.graph import sparse_laplacian
 from gerrychain.graph.geo import GeometryError
 
 
@@ -76,6 +79,18 @@ def test_add_data_to_graph_can_handle_column_names_that_start_with_numbers():
     assert graph.nodes["03"]["16SenDVote"] == 50
 
 
+def test_add_data_skips_rows_without_a_matching_node():
+    graph = Graph([("01", "02")])
+    df = pandas.DataFrame(
+        {"16SenDVote": [20, 30, 50], "node": ["01", "02", "03"]}
+    ).set_index("node")
+
+    graph.add_data(df)
+
+    assert set(graph.nodes) == {"01", "02"}
+    assert graph.nodes["02"]["16SenDVote"] == 30
+
+
 def test_join_can_handle_right_index():
     graph = Graph([("01", "02"), ("02", "03"), ("03", "01")])
     df = pandas.DataFrame({"16SenDVote": [20, 30, 50], "node": ["01", "02", "03"]})
@@ -87,6 +102,88 @@ def test_join_can_handle_right_index():
     assert graph.nodes["03"]["16SenDVote"] == 50
 
 
+def test_join_keeps_the_last_row_for_a_repeated_index():
+    graph = Graph.from_networkx(networkx.path_graph(3))
+    df = pandas.DataFrame({"value": [1, 2, 3, 4]}, index=[0, 0, 1, 2])
+
+    graph.join(df)
+
+    assert networkx.get_node_attributes(graph, "value") == {0: 2, 1: 3, 2: 4}
+
+
+def test_join_can_handle_left_index():
+    graph = Graph([(0, 1), (1, 2), (2, 0)])
+    for node, geoid in zip(graph.nodes, ["01", "02", "03"]):
+        graph.nodes[node]["GEOID"] = geoid
+    df = pandas.DataFrame({"16SenDVote": [50, 20, 30]}, index=["03", "01", "02"])
+
+    graph.join(df, left_index="GEOID")
+
+    assert graph.nodes[0]["16SenDVote"] == 20
+    assert graph.nodes[1]["16SenDVote"] == 30
+    assert graph.nodes[2]["16SenDVote"] == 50
+
+
+def test_from_networkx_copies_the_graph():
+    nx_graph = networkx.path_graph(5)
+    nx_graph.graph["name"] = "path"
+    for node in nx_graph:
+        nx_graph.nodes[node]["population"] = node
+    for u, v in nx_graph.edges:
+        nx_graph.edges[u, v]["shared_perim"] = u + v
+
+    graph = Graph.from_networkx(nx_graph)
+    graph.nodes[0]["population"] = 100
+
+    assert isinstance(graph, Graph)
+    assert graph.graph == nx_graph.graph
+    assert list(graph.adjacency()) == list(nx_graph.adjacency())
+    assert list(graph.edges(data=True)) == list(nx_graph.edges(data=True))
+    assert nx_graph.nodes[0]["population"] == 0
+
+
+@pytest.mark.parametrize("normalized", [False, True])
+def test_sparse_laplacian_matches_networkx(normalized):
+    graph = Graph.from_networkx(networkx.grid_graph([4, 5]))
+    for index, edge in enumerate(graph.edges):
+        graph.edges[edge]["weight"] = 1 + index % 3
+    graph.add_node("isolated")
+    nodes = list(graph.nodes)
+
+    laplacian = sparse_laplacian(graph, nodes, normalized=normalized)
+
+    if normalized:
+        expected = networkx.normalized_laplacian_matrix(graph, nodelist=nodes)
+    else:
+        expected = networkx.laplacian_matrix(graph, nodelist=nodes)
+    assert numpy.allclose(laplacian.toarray(), expected.toarray())
+
+
+def test_frozen_graph_does_not_cache_subgraph_laplacians_by_default():
+    graph = FrozenGraph(Graph.from_networkx(networkx.grid_graph([4, 5])))
+    nodes = frozenset(list(graph.nodes)[:8])
+
+    node_list, laplacian = graph.subgraph_laplacian(nodes)
+
+    assert set(node_list) == nodes
+    assert laplacian.shape == (8, 8)
+    assert graph.subgraph_laplacian(nodes)[1] is not laplacian
+
+
+def test_frozen_graph_caches_subgraph_laplacians_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(FrozenGraph, "max_cached_laplacians", 2)
+    graph = FrozenGraph(Graph.from_networkx(networkx.grid_graph([4, 5])))
+    node_list = list(graph.nodes)
+    first, second, third = (frozenset(node_list[i:i + 4]) for i in (0, 4, 8))
+
+    laplacian = graph.subgraph_laplacian(first)[1]
+    assert graph.subgraph_laplacian(first)[1] is laplacian
+
+    graph.subgraph_laplacian(second)
+    graph.subgraph_laplacian(third)
+    assert graph.subgraph_laplacian(first)[1] is not laplacian
+
+
 def test_make_graph_from_dataframe_creates_graph(geodataframe):
     graph = Graph.from_geodataframe(geodataframe)
     assert isinstance(graph, Graph)
@@ -210,6 +307,23 @@ def test_from_file_and_then_to_json_with_geometries(shapefile, target_file):
     graph.to_json(target_file, include_geometries_as_geojson=True)
 
 
+def test_to_json_and_then_from_json_round_trips(target_file):
+    graph = Graph.from_networkx(networkx.path_graph(4))
+    graph.graph["name"] = "path"
+    for node in graph:
+        graph.nodes[node]["population"] = 10 * node
+    for index, edge in enumerate(graph.edges):
+        graph.edges[edge]["shared_perim"] = index
+
+    graph.to_json(target_file)
+    loaded = Graph.from_json(target_file)
+
+    assert isinstance(loaded, Graph)
+    assert loaded.graph == graph.graph
+    assert dict(loaded.nodes(data=True)) == dict(graph.nodes(data=True))
+    assert sorted(loaded.edges(data=True)) == sorted(graph.edges(data=True))
+
+
 def test_graph_warns_for_islands():
     graph = Graph()
     graph.add_node(0)
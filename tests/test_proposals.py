@@ -1,6 +1,10 @@
+import random
+
+import networkx
 import pytest
 
-from gerrychain import Partition, proposals, updaters
+from gerrychain import Graph, Partition, proposals, updaters
+from gerrychain.proposals.spectral_proposals import spectral_cut
 
 
 @pytest.fixture
@@ -30,3 +34,49 @@ def partition(graph):
 def test_proposal_returns_a_partition(proposal, partition):
     proposed = proposal(partition)
     assert isinstance(proposed, partition.__class__)
+
+
+@pytest.mark.parametrize("lap_type", ["normalized", "combinatorial"])
+@pytest.mark.parametrize("clique_size", [6, 120])
+def test_spectral_cut_separates_two_cliques(lap_type, clique_size):
+    graph = Graph.from_networkx(networkx.barbell_graph(clique_size, 0))
+
+    clusters = spectral_cut(graph, ("a", "b"), None, lap_type)
+
+    assert set(clusters) == set(graph.nodes)
+    left = {clusters[node] for node in range(clique_size)}
+    right = {clusters[node] for node in range(clique_size, 2 * clique_size)}
+    assert len(left) == len(right) == 1
+    assert left != right
+
+
+def test_spectral_cut_with_random_weights_does_not_modify_the_graph():
+    graph = Graph.from_networkx(networkx.barbell_graph(6, 0))
+
+    clusters = spectral_cut(graph, ("a", "b"), "random", "normalized")
+
+    assert set(clusters.values()) == {"a", "b"}
+    assert all("weight" not in data for _, _, data in graph.edges(data=True))
+
+
+@pytest.mark.parametrize("lap_type", ["normalized", "combinatorial"])
+def test_spectral_cut_is_reproducible_under_a_fixed_seed(lap_type):
+    graph = Graph.from_networkx(networkx.grid_2d_graph(20, 15))
+
+    cuts = []
+    for _ in range(4):
+        random.seed(0)
+        cuts.append(spectral_cut(graph, ("a", "b"), None, lap_type))
+
+    assert all(cut == cuts[0] for cut in cuts)
+
+
+@pytest.mark.parametrize("weight_type", [None, "random"])
+@pytest.mark.parametrize("lap_type", ["normalized", "combinatorial"])
+def test_spectral_recom_returns_a_partition(partition, weight_type, lap_type):
+    proposed = proposals.spectral_recom(
+        partition, weight_type=weight_type, lap_type=lap_type
+    )
+
+    assert isinstance(proposed, partition.__class__)
+    assert set(proposed.assignment) == set(partition.assignment)
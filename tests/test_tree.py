@@ -19,6 +19,8 @@ from gerrychain.tree import (
     uniform_spanning_tree,
     get_max_prime_factor_less_than,
     bipartition_tree_random,
+    predecessors,
+    successors,
 )
 from gerrychain.updaters import Tally, cut_edges
 from functools import partial
@@ -265,6 +267,19 @@ def test_random_spanning_tree_returns_tree_with_pop_attribute(graph_with_pop):
     assert networkx.is_tree(tree)
 
 
+def test_random_spanning_tree_surcharges_edges_leaving_a_region(graph_with_pop):
+    for node in graph_with_pop:
+        graph_with_pop.nodes[node]["county"] = None if node == 8 else node // 3
+
+    tree = random_spanning_tree(graph_with_pop, region_surcharge={"county": 10})
+
+    assert networkx.is_tree(tree)
+    for u, v, data in graph_with_pop.edges(data=True):
+        county = graph_with_pop.nodes[u]["county"]
+        surcharged = county is None or county != graph_with_pop.nodes[v]["county"]
+        assert (data["random_weight"] >= 10) == surcharged
+
+
 def test_uniform_spanning_tree_returns_tree_with_pop_attribute(graph_with_pop):
     tree = uniform_spanning_tree(graph_with_pop)
     assert networkx.is_tree(tree)
@@ -385,6 +400,18 @@ def test_no_balanced_cuts_memo_when_one_side_okay():
     assert cuts == []
 
 
+def test_predecessors_and_successors_match_networkx_bfs(twelve_by_twelve_with_pop):
+    tree = random_spanning_tree(twelve_by_twelve_with_pop)
+    root = 77
+
+    assert list(predecessors(tree, root).items()) == list(
+        networkx.bfs_predecessors(tree, root)
+    )
+    assert list(successors(tree, root).items()) == list(
+        networkx.bfs_successors(tree, root)
+    )
+
+
 def test_prime_bound():
     assert (
         get_max_prime_factor_less_than(2024, 20) == 11
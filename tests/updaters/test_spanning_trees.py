@@ -1,3 +1,5 @@
+import networkx
+
 from gerrychain import Partition
 from gerrychain.updaters import num_spanning_trees
 
@@ -11,3 +13,14 @@ def test_get_num_spanning_trees(three_by_three_grid):
     )
     assert 192 == round(partition["num_spanning_trees"][1])
     assert [1] == list(partition["num_spanning_trees"].keys())
+
+
+def test_get_num_spanning_trees_of_disconnected_district():
+    graph = networkx.path_graph(4)
+    partition = Partition(
+        graph,
+        {0: 0, 1: 1, 2: 1, 3: 0},
+        {"num_spanning_trees": num_spanning_trees}
+    )
+    assert partition["num_spanning_trees"][0] == 0
+    assert 1 == round(partition["num_spanning_trees"][1])